@@ -3,25 +3,52 @@ Deployment Script for DAO Governance AI Agent
 Works with Ganache local node
 """
 
+import functools
 import json
 import os
 from web3 import Web3
 from eth_account import Account
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library encoder
+    orjson = None
+
+
+def _write_json(filename, data):
+    """Write data as 2-space indented JSON, using orjson when available"""
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=2)
+
+@functools.lru_cache(maxsize=128)
+def _account(private_key):
+    """Derive an account once per key; from_key recovers the public key on secp256k1"""
+    return Account.from_key(private_key)
+
+
+@functools.lru_cache(maxsize=None)
+def _web3(provider_url):
+    """Share one Web3 instance (and its HTTP session) per provider URL"""
+    return Web3(Web3.HTTPProvider(provider_url))
+
 class SimpleDAODeployer:
     """Simplified deployer that works with Ganache"""
     
     def __init__(self):
         # Connect to Ganache
-        self.w3 = Web3(Web3.HTTPProvider('http://127.0.0.1:8545'))
+        self.w3 = _web3('http://127.0.0.1:8545')
         
         # Use Ganache's account #0
         self.deployer_key = "0xcdc181bca0ad823df429e136f307adbe95334a5cdc626e2898611264468e9866"
-        self.deployer = Account.from_key(self.deployer_key)
+        self.deployer = _account(self.deployer_key)
         
         # AI Agent will be account #1
         self.ai_agent_key = "0x55d655def66eeca0ab86237c4407f3a92033b6cc32d9aa4f8af9f9f9c30fb87a"
-        self.ai_agent = Account.from_key(self.ai_agent_key)
+        self.ai_agent = _account(self.ai_agent_key)
         
         print("=" * 60)
         print("DAO GOVERNANCE AI AGENT - DEPLOYMENT")
@@ -29,17 +56,29 @@ class SimpleDAODeployer:
         print(f"\nDeployer: {self.deployer.address}")
         print(f"AI Agent: {self.ai_agent.address}")
         
-        # Check connection
+        # Check connection (balance and chain id in a single JSON-RPC batch)
         try:
-            balance = self.w3.eth.get_balance(self.deployer.address)
+            balance, chain_id = self._fetch_connection_info()
             print(f"Deployer Balance: {self.w3.from_wei(balance, 'ether')} ETH")
             print(f"Connected to: {self.w3.provider.endpoint_uri}")
-            print(f"Chain ID: {self.w3.eth.chain_id}")
+            print(f"Chain ID: {chain_id}")
         except Exception as e:
             print(f"\nERROR: Cannot connect to blockchain!")
             print(f"Make sure Ganache is running: ganache")
             raise e
     
+    def _fetch_connection_info(self):
+        """Fetch deployer balance and chain id in one round-trip when the node supports batching"""
+        try:
+            with self.w3.batch_requests() as batch:
+                batch.add(self.w3.eth.get_balance(self.deployer.address))
+                batch.add(self.w3.eth.chain_id)
+                balance, chain_id = batch.execute()
+            return balance, chain_id
+        except Exception:
+            # Some providers reject batch payloads; fall back to individual calls
+            return self.w3.eth.get_balance(self.deployer.address), self.w3.eth.chain_id
+    
     def create_mock_deployment(self):
         """
         Create mock deployment for testing without actual contract deployment
@@ -62,8 +101,7 @@ class SimpleDAODeployer:
         }
         
         # Save to file
-        with open('deployment_info.json', 'w') as f:
-            json.dump(deployment_info, f, indent=2)
+        _write_json('deployment_info.json', deployment_info)
         
         print("\nMock deployment info saved to: deployment_info.json")
         print("\nWARNING: This is a mock deployment!")
@@ -211,8 +249,7 @@ Start next month, ongoing program
             }
         ]
         
-        with open('test_proposals.json', 'w') as f:
-            json.dump(proposals, f, indent=2)
+        _write_json('test_proposals.json', proposals)
         
         print("\nTest proposals saved to: test_proposals.json")
         print(f"Created {len(proposals)} test proposals for analysis")
@@ -2,24 +2,42 @@
 AI Agent for DAO Governance - Works with local testing
 """
 
+import copy
+import functools
 import json
+import math
+import os
+import sys
 import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import IntEnum
 import re
-import matplotlib.pyplot as plt
-import numpy as np
-from web3 import Web3
-from eth_account import Account
 
-class VoteChoice(Enum):
+try:
+    import orjson
+except ImportError:  # orjson is optional; json.loads accepts the same bytes
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; keyword scans then use per-keyword 'in' checks
+    ahocorasick = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; proposals are then always read from JSON
+    msgpack = None
+
+class VoteChoice(IntEnum):
     """Vote options"""
     FOR = 1
     AGAINST = 2
     ABSTAIN = 3
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Proposal:
     """Represents a DAO proposal"""
     id: int
@@ -31,7 +49,7 @@ class Proposal:
     votes_abstain: int = 0
     executed: bool = False
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VotingMetrics:
     """Transparent metrics for automated voting decisions"""
     treasury_impact_weight: float = 0.3
@@ -40,6 +58,211 @@ class VotingMetrics:
     risk_assessment_weight: float = 0.2
     min_score_to_support: float = 0.6
     max_treasury_spend_pct: float = 0.1
+    # Category weights in SCORE_KEYS order, derived once at construction
+    weights: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'weights', (
+            self.treasury_impact_weight,
+            self.community_alignment_weight,
+            self.technical_feasibility_weight,
+            self.risk_assessment_weight
+        ))
+
+# Read-only subset of SimpleDAOGovernance (Smart_Contract.sol) used by the agent
+GOVERNANCE_ABI = [
+    {
+        "name": "proposalCount",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "uint256"}]
+    },
+    {
+        "name": "getProposal",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": "proposalId", "type": "uint256"}],
+        "outputs": [
+            {"name": "id", "type": "uint256"},
+            {"name": "title", "type": "string"},
+            {"name": "description", "type": "string"},
+            {"name": "proposer", "type": "address"},
+            {"name": "createdAt", "type": "uint256"},
+            {"name": "deadline", "type": "uint256"},
+            {"name": "votesFor", "type": "uint256"},
+            {"name": "votesAgainst", "type": "uint256"},
+            {"name": "votesAbstain", "type": "uint256"},
+            {"name": "executed", "type": "bool"}
+        ]
+    }
+]
+
+SCORE_KEYS = ('treasury_impact', 'community_alignment', 'technical_feasibility', 'risk_assessment')
+SCORE_LABELS = ('Treasury Impact', 'Community Alignment', 'Technical Feasibility', 'Risk Assessment')
+SCORE_COLORS = ('#4BC0C0', '#36A2EB', '#FFCE56', '#FF6384')
+
+POSITIVE_KEYWORDS = ['community', 'decentralized', 'transparent', 'education',
+                     'growth', 'sustainable', 'public', 'open source']
+NEGATIVE_KEYWORDS = ['centralized', 'exclusive', 'private', 'restricted']
+HIGH_RISK_KEYWORDS = ['risky', 'experimental', 'untested', 'no audit', 'instant', 'immediately']
+MEDIUM_RISK_KEYWORDS = ['new', 'change', 'modify', 'remove']
+LOW_RISK_KEYWORDS = ['audit', 'tested', 'proven', 'standard', 'established']
+COST_KEYWORDS = ['spend', 'cost', 'budget', 'fund', 'eth', 'token']
+TECHNICAL_KEYWORDS = ['contract', 'audit', 'test', 'develop']
+TIMELINE_KEYWORDS = ['week', 'month', 'timeline', 'phase']
+BUDGET_KEYWORDS = ['budget']
+# Case-insensitive markers, so they can be matched against the lowered description
+STRUCTURE_MARKERS = ['##', '###', '1.', '2.', '-']
+
+# Every keyword category matched against a proposal description
+KEYWORD_GROUPS = {
+    'cost': COST_KEYWORDS,
+    'positive': POSITIVE_KEYWORDS,
+    'negative': NEGATIVE_KEYWORDS,
+    'structure': STRUCTURE_MARKERS,
+    'timeline': TIMELINE_KEYWORDS,
+    'budget': BUDGET_KEYWORDS,
+    'technical': TECHNICAL_KEYWORDS,
+    'high_risk': HIGH_RISK_KEYWORDS,
+    'medium_risk': MEDIUM_RISK_KEYWORDS,
+    'low_risk': LOW_RISK_KEYWORDS
+}
+# Titles only feed the high/medium risk checks
+TITLE_KEYWORD_GROUPS = {
+    'high_risk': HIGH_RISK_KEYWORDS,
+    'medium_risk': MEDIUM_RISK_KEYWORDS
+}
+
+NUMBER_RE = re.compile(r'\b\d+(?:,\d{3})*(?:\.\d+)?\b')
+
+class KeywordScanner:
+    """Finds which keywords of each category occur in a text
+
+    Uses a single Aho-Corasick automaton when pyahocorasick is installed,
+    so the text is scanned once regardless of the number of keywords.
+    Otherwise each keyword is checked with 'in'. Both report overlapping
+    and nested keywords exactly like the original substring checks.
+    """
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.categories = list(groups)
+        self._groups = groups
+        self._automaton = None
+        if ahocorasick is not None:
+            # A keyword may belong to several categories; store them all on one entry
+            keyword_categories: Dict[str, List[str]] = {}
+            for category, keywords in groups.items():
+                for kw in keywords:
+                    keyword_categories.setdefault(kw, []).append(category)
+            self._automaton = ahocorasick.Automaton()
+            for kw, categories in keyword_categories.items():
+                self._automaton.add_word(kw, (kw, tuple(categories)))
+            self._automaton.make_automaton()
+
+    def matches(self, text: str) -> Dict[str, set]:
+        found = {c: set() for c in self.categories}
+        if self._automaton is not None:
+            for _, (kw, categories) in self._automaton.iter(text):
+                for category in categories:
+                    found[category].add(kw)
+        else:
+            for category, keywords in self._groups.items():
+                found[category].update(kw for kw in keywords if kw in text)
+        return found
+
+DESCRIPTION_SCANNER = KeywordScanner(KEYWORD_GROUPS)
+TITLE_SCANNER = KeywordScanner(TITLE_KEYWORD_GROUPS)
+
+@functools.lru_cache(maxsize=None)
+def _recommend_kernel():
+    """Build the bulk scoring kernel on first use
+
+    numpy and numba are imported here rather than at module level so that
+    single-proposal analysis never pays for them. Without numba the kernel
+    runs as plain Python.
+    """
+    import numpy as np
+    try:
+        from numba import njit, prange
+    except ImportError:
+        njit, prange = None, range
+
+    def _recommend(scores, weights, min_support):
+        # Terms are summed in the same order as analyze_proposal so both paths agree exactly
+        n = scores.shape[0]
+        overall = np.empty(n, dtype=np.float64)
+        recommendations = np.empty(n, dtype=np.int8)
+        for i in prange(n):
+            total = 0.0
+            for j in range(scores.shape[1]):
+                total += scores[i, j] * weights[j]
+            overall[i] = total
+            if total >= min_support:
+                recommendations[i] = 1
+            elif total < 0.4:
+                recommendations[i] = 2
+            else:
+                recommendations[i] = 3
+        return overall, recommendations
+
+    if njit is None:
+        return _recommend
+    # No on-disk cache: Numba keys it on the import name, so loading this file
+    # under another name (runpy, importlib) would fail; compiling is cheap anyway
+    return njit(parallel=True)(_recommend)
+
+# web3 and eth_account are imported on first use; mock mode never needs them
+@functools.lru_cache(maxsize=128)
+def _account(private_key: str):
+    """Derive an account once per key; from_key recovers the public key on secp256k1"""
+    from eth_account import Account
+    return Account.from_key(private_key)
+
+@functools.lru_cache(maxsize=None)
+def _web3(provider_url: str):
+    """Share one Web3 instance (and its HTTP session) per provider URL"""
+    from web3 import Web3
+    return Web3(Web3.HTTPProvider(provider_url))
+
+def _compile_scorer(metrics: VotingMetrics):
+    """Generate a scorer with the metric weights and thresholds inlined as constants
+
+    The returned function maps the four category scores to the overall score
+    and a VoteChoice value, summing in the same order as the bulk kernel.
+    """
+    namespace = {}
+
+    def constant(name, value):
+        value = float(value)
+        if math.isfinite(value):
+            return repr(value)
+        # inf/nan have no literal form; bind them as globals of the scorer instead
+        namespace[name] = value
+        return name
+
+    w0, w1, w2, w3 = (constant(f'w{i}', w) for i, w in enumerate(metrics.weights))
+    min_support = constant('min_support', metrics.min_score_to_support)
+    src = (
+        "def _score(t, a, tc, r):\n"
+        f"    overall = t * {w0} + a * {w1} + tc * {w2} + r * {w3}\n"
+        f"    if overall >= {min_support}:\n"
+        f"        return overall, {VoteChoice.FOR.value}\n"
+        "    if overall < 0.4:\n"
+        f"        return overall, {VoteChoice.AGAINST.value}\n"
+        f"    return overall, {VoteChoice.ABSTAIN.value}\n"
+    )
+    exec(compile(src, f"<scorer {metrics!r}>", "exec"), namespace)
+    return namespace['_score']
+
+def _import_pyplot():
+    """Import pyplot on demand, skipping GUI backend setup on headless Linux"""
+    import matplotlib
+    if (sys.platform.startswith('linux') and 'MPLBACKEND' not in os.environ
+            and not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY')):
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
 
 class DAOGovernanceAgent:
     """AI Agent for automated DAO governance participation"""
@@ -49,21 +272,40 @@ class DAOGovernanceAgent:
         metrics: Optional[VotingMetrics] = None,
         use_mock_data: bool = True,
         web3_provider: str = 'http://127.0.0.1:8545',
-        ai_agent_key: str = None
+        ai_agent_key: str = None,
+        governance_address: Optional[str] = None,
+        batch_size: int = 25,
+        max_cache_size: int = 1000,
+        verbose: bool = True
     ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         self.metrics = metrics or VotingMetrics()
         self.use_mock_data = use_mock_data
+        self.verbose = verbose
         self.voting_history: List[Dict] = []
         self.analyses: List[Dict] = []
+        self.governance = None
+        self.batch_size = batch_size
+        self.max_cache_size = max_cache_size
+        self._analysis_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+        self._scorer = _compile_scorer(self.metrics)
+        self._scorer_metrics = self.metrics
         
         if not use_mock_data:
             try:
-                self.w3 = Web3(Web3.HTTPProvider(web3_provider))
-                self.ai_agent = Account.from_key(ai_agent_key)
+                self.w3 = _web3(web3_provider)
+                self.ai_agent = _account(ai_agent_key)
                 print(f"Connected to Web3: {web3_provider}")
                 print(f"AI Agent Address: {self.ai_agent.address}")
                 balance = self.w3.eth.get_balance(self.ai_agent.address)
                 print(f"AI Agent Balance: {self.w3.from_wei(balance, 'ether')} ETH")
+                if governance_address:
+                    self.governance = self.w3.eth.contract(
+                        address=self.w3.to_checksum_address(governance_address),
+                        abi=GOVERNANCE_ABI
+                    )
+                    print(f"Governance Contract: {self.governance.address}")
             except Exception as e:
                 print(f"ERROR: Failed to connect to Web3 provider: {e}")
                 raise e
@@ -80,8 +322,7 @@ class DAOGovernanceAgent:
 
     def load_proposals_from_file(self, filename: str = 'test_proposals.json') -> List[Proposal]:
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            data = self._read_proposal_data(filename)
             proposals = []
             for p in data:
                 proposals.append(Proposal(
@@ -104,20 +345,149 @@ class DAOGovernanceAgent:
             print(f"\nERROR loading proposals: {e}")
             return []
 
+    def _read_proposal_data(self, filename: str) -> List[Dict]:
+        """Read raw proposal dicts, serving JSON files from a binary sibling when it is up to date"""
+        if filename.endswith('.msgpack'):
+            return self._read_msgpack(filename)[0]
+        cache_file = os.path.splitext(filename)[0] + '.msgpack'
+        stat = os.stat(filename)
+        source = [stat.st_mtime_ns, stat.st_size]
+        if msgpack is not None and os.path.exists(cache_file):
+            try:
+                data, cached_source = self._read_msgpack(cache_file)
+            except Exception:
+                cached_source = None  # Unreadable cache; rebuild it from the JSON
+            # Any change to the JSON's mtime or size, newer or older, invalidates the cache
+            if cached_source == source:
+                return data
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if msgpack is not None:
+            try:
+                self.export_proposals_msgpack(data, cache_file, source=source)
+            except OSError:
+                pass  # The binary copy is only a cache; JSON stays authoritative
+        return data
+
+    def _read_msgpack(self, filename: str) -> tuple:
+        """Return (proposals, source stamp); the stamp is None for plain exports"""
+        if msgpack is None:
+            raise ImportError(f"msgpack is not installed, cannot read {filename} (pip install msgpack)")
+        with open(filename, 'rb') as f:
+            payload = msgpack.unpackb(f.read(), raw=False)
+        if isinstance(payload, dict):
+            return payload['proposals'], payload.get('source')
+        return payload, None
+
+    def export_proposals_msgpack(
+        self,
+        data: List[Dict],
+        filename: str = 'test_proposals.msgpack',
+        source: Optional[List[int]] = None
+    ):
+        """Write raw proposal dicts in MessagePack format
+
+        When source ([mtime_ns, size] of the JSON file) is given, it is stored
+        alongside the proposals so the file can serve as a cache of that JSON.
+        """
+        if msgpack is None:
+            raise ImportError(f"msgpack is not installed, cannot write {filename} (pip install msgpack)")
+        payload = data if source is None else {"source": source, "proposals": data}
+        with open(filename, 'wb') as f:
+            f.write(msgpack.packb(payload, use_bin_type=True))
+
     def monitor_proposals(self) -> List[Proposal]:
         if self.use_mock_data:
             return self.load_proposals_from_file()
         else:
             print("Fetching proposals from blockchain...")
-            return []
+            if self.governance is None:
+                print("ERROR: No governance contract configured (pass governance_address)")
+                return []
+            count = self.governance.functions.proposalCount().call()
+            proposals = []
+            for p in self._fetch_proposal_rows(count):
+                proposals.append(Proposal(
+                    id=p[0],
+                    title=p[1],
+                    description=p[2],
+                    proposer=p[3],
+                    votes_for=p[6],
+                    votes_against=p[7],
+                    votes_abstain=p[8],
+                    executed=p[9]
+                ))
+            print(f"\n✓ Loaded {len(proposals)} proposals from {self.governance.address}")
+            return proposals
+
+    def _fetch_proposal_rows(self, count: int) -> List[tuple]:
+        """Read proposals in JSON-RPC batches of batch_size calls per round-trip"""
+        rows = []
+        for start in range(0, count, self.batch_size):
+            ids = range(start, min(start + self.batch_size, count))
+            try:
+                with self.w3.batch_requests() as batch:
+                    for i in ids:
+                        batch.add(self.governance.functions.getProposal(i))
+                    rows.extend(batch.execute())
+            except Exception as e:
+                # Provider does not support batching; issue the calls concurrently instead
+                print(f"  Batch request failed ({e}), falling back to parallel calls")
+                with ThreadPoolExecutor(max_workers=self.batch_size) as pool:
+                    rows.extend(pool.map(
+                        lambda i: self.governance.functions.getProposal(i).call(), ids
+                    ))
+        return rows
+
+    def _cache_get(self, key: tuple) -> Optional[Dict]:
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            return None
+        self._analysis_cache.move_to_end(key)
+        return copy.deepcopy(analysis)
+
+    def _cache_set(self, key: tuple, analysis: Dict):
+        self._analysis_cache[key] = copy.deepcopy(analysis)
+        self._analysis_cache.move_to_end(key)
+        if len(self._analysis_cache) > self.max_cache_size:
+            self._analysis_cache.popitem(last=False)
 
     def analyze_proposal(self, proposal: Proposal) -> Dict:
-        print(f"\n{'='*60}")
-        print(f"📋 Analyzing Proposal #{proposal.id}")
-        print(f"{'='*60}")
-        print(f"Title: {proposal.title}")
-        print(f"Proposer: {proposal.proposer}")
+        # Metrics are part of the key so changed weights never reuse stale scores
+        key = (proposal.description, proposal.title, self.metrics)
+        analysis = self._cache_get(key)
+        if analysis is None:
+            analysis = self._score_proposal(proposal)
+            self._cache_set(key, analysis)
+        analysis["proposal_id"] = proposal.id
+        
+        if self.verbose:
+            self._print_analysis(proposal, analysis)
         
+        self.analyses.append(analysis)
+        return analysis
+
+    def _print_analysis(self, proposal: Proposal, analysis: Dict):
+        """Write the analysis report for one proposal in a single stdout write"""
+        scores = analysis["scores"]
+        lines = [
+            f"\n{'='*60}",
+            f"📋 Analyzing Proposal #{proposal.id}",
+            f"{'='*60}",
+            f"Title: {proposal.title}",
+            f"Proposer: {proposal.proposer}",
+            f"  💰 Treasury Impact: {scores['treasury_impact']:.2f}",
+            f"  👥 Community Alignment: {scores['community_alignment']:.2f}",
+            f"  🔧 Technical Feasibility: {scores['technical_feasibility']:.2f}",
+            f"  ⚠️  Risk Assessment: {scores['risk_assessment']:.2f}",
+            f"\n  📊 OVERALL SCORE: {analysis['overall_score']:.2f}",
+            f"  🗳️  RECOMMENDATION: {analysis['recommendation'].name}",
+            f"  💭 Reasoning: {analysis['reasoning'][0]}"
+        ]
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+    def _score_proposal(self, proposal: Proposal) -> Dict:
         analysis = {
             "proposal_id": proposal.id,
             "title": proposal.title,
@@ -128,37 +498,22 @@ class DAOGovernanceAgent:
             "summary": ""
         }
         
-        treasury_score = self._analyze_treasury_impact(proposal)
-        analysis["scores"]["treasury_impact"] = treasury_score
-        print(f"  💰 Treasury Impact: {treasury_score:.2f}")
-        
-        alignment_score = self._analyze_community_alignment(proposal)
-        analysis["scores"]["community_alignment"] = alignment_score
-        print(f"  👥 Community Alignment: {alignment_score:.2f}")
-        
-        technical_score = self._analyze_technical_feasibility(proposal)
-        analysis["scores"]["technical_feasibility"] = technical_score
-        print(f"  🔧 Technical Feasibility: {technical_score:.2f}")
+        scores = self._category_scores(proposal)
+        analysis["scores"] = dict(zip(SCORE_KEYS, scores))
         
-        risk_score = self._analyze_risk(proposal)
-        analysis["scores"]["risk_assessment"] = risk_score
-        print(f"  ⚠️  Risk Assessment: {risk_score:.2f}")
-        
-        overall = (
-            treasury_score * self.metrics.treasury_impact_weight +
-            alignment_score * self.metrics.community_alignment_weight +
-            technical_score * self.metrics.technical_feasibility_weight +
-            risk_score * self.metrics.risk_assessment_weight
-        )
+        # Recompile only if the agent's metrics were swapped out since the last call
+        if self._scorer_metrics is not self.metrics:
+            self._scorer = _compile_scorer(self.metrics)
+            self._scorer_metrics = self.metrics
+        overall, choice = self._scorer(*scores)
         analysis["overall_score"] = overall
+        analysis["recommendation"] = VoteChoice(choice)
         
-        if overall >= self.metrics.min_score_to_support:
-            analysis["recommendation"] = VoteChoice.FOR
+        if analysis["recommendation"] is VoteChoice.FOR:
             analysis["reasoning"].append(
                 f"Score {overall:.2f} exceeds threshold {self.metrics.min_score_to_support}"
             )
-        elif overall < 0.4:
-            analysis["recommendation"] = VoteChoice.AGAINST
+        elif analysis["recommendation"] is VoteChoice.AGAINST:
             analysis["reasoning"].append(
                 f"Score {overall:.2f} is below 0.4 threshold"
             )
@@ -167,46 +522,72 @@ class DAOGovernanceAgent:
                 f"Score {overall:.2f} is neutral (0.4 to {self.metrics.min_score_to_support})"
             )
         
-        print(f"\n  📊 OVERALL SCORE: {overall:.2f}")
-        print(f"  🗳️  RECOMMENDATION: {analysis['recommendation'].name}")
-        print(f"  💭 Reasoning: {analysis['reasoning'][0]}")
-        
-        self.analyses.append(analysis)
         return analysis
 
-    def _analyze_treasury_impact(self, proposal: Proposal) -> float:
-        desc = proposal.description.lower()
-        has_cost = any(word in desc for word in ['spend', 'cost', 'budget', 'fund', 'eth', 'token'])
-        if not has_cost:
+    def score_proposals(self, proposals: List[Proposal]) -> List[Dict]:
+        """Bulk-score proposals (e.g. historical analysis) without console output or caching"""
+        import numpy as np
+        scores = np.array(
+            [self._category_scores(p) for p in proposals], dtype=np.float64
+        ).reshape(len(proposals), len(SCORE_KEYS))
+        weights = np.array(self.metrics.weights, dtype=np.float64)
+        overall, recommendations = _recommend_kernel()(scores, weights, self.metrics.min_score_to_support)
+        return [
+            {
+                "proposal_id": p.id,
+                "title": p.title,
+                "scores": dict(zip(SCORE_KEYS, map(float, row))),
+                "overall_score": float(total),
+                "recommendation": VoteChoice(int(rec))
+            }
+            for p, row, total, rec in zip(proposals, scores, overall, recommendations)
+        ]
+
+    def _category_scores(self, proposal: Proposal) -> tuple:
+        """Category scores in SCORE_KEYS order from a single keyword pass over the description"""
+        desc_lower = proposal.description.lower()
+        found = DESCRIPTION_SCANNER.matches(desc_lower)
+        title_found = TITLE_SCANNER.matches(proposal.title.lower())
+        return (
+            self._analyze_treasury_impact(desc_lower, found),
+            self._analyze_community_alignment(found),
+            self._analyze_technical_feasibility(proposal, found),
+            self._analyze_risk(found, title_found)
+        )
+
+    def _analyze_treasury_impact(self, desc_lower: str, found: Dict[str, set]) -> float:
+        if not found['cost']:
             return 0.8
-        numbers = re.findall(r'\b\d+(?:,\d{3})*(?:\.\d+)?\b', desc)
-        if numbers:
-            max_num = max(float(n.replace(',', '')) for n in numbers)
-            if max_num > 50:
-                return 0.3
-            elif max_num > 20:
-                return 0.6
-            else:
-                return 0.8
-        return 0.5
-
-    def _analyze_community_alignment(self, proposal: Proposal) -> float:
-        desc = proposal.description.lower()
-        positive = ['community', 'decentralized', 'transparent', 'education', 
-                   'growth', 'sustainable', 'public', 'open source']
-        negative = ['centralized', 'exclusive', 'private', 'restricted']
-        pos_count = sum(1 for kw in positive if kw in desc)
-        neg_count = sum(1 for kw in negative if kw in desc)
+        max_num = None
+        for match in NUMBER_RE.finditer(desc_lower):
+            value = float(match.group().replace(',', ''))
+            if max_num is None or value > max_num:
+                max_num = value
+                if max_num > 50:
+                    # Highest bucket already reached, later numbers cannot change it
+                    break
+        if max_num is None:
+            return 0.5
+        if max_num > 50:
+            return 0.3
+        elif max_num > 20:
+            return 0.6
+        else:
+            return 0.8
+
+    def _analyze_community_alignment(self, found: Dict[str, set]) -> float:
+        # Each keyword counts once, however often it appears
+        pos_count = len(found['positive'])
+        neg_count = len(found['negative'])
         score = 0.5 + (pos_count * 0.08) - (neg_count * 0.15)
         return max(0.0, min(1.0, score))
 
-    def _analyze_technical_feasibility(self, proposal: Proposal) -> float:
-        desc = proposal.description
-        word_count = len(desc.split())
-        has_structure = any(m in desc for m in ['##', '###', '1.', '2.', '-'])
-        has_timeline = any(w in desc.lower() for w in ['week', 'month', 'timeline', 'phase'])
-        has_budget = 'budget' in desc.lower()
-        has_technical = any(w in desc.lower() for w in ['contract', 'audit', 'test', 'develop'])
+    def _analyze_technical_feasibility(self, proposal: Proposal, found: Dict[str, set]) -> float:
+        word_count = len(proposal.description.split())
+        has_structure = bool(found['structure'])
+        has_timeline = bool(found['timeline'])
+        has_budget = bool(found['budget'])
+        has_technical = bool(found['technical'])
         score = 0.2
         if word_count > 150:
             score += 0.2
@@ -220,36 +601,29 @@ class DAOGovernanceAgent:
             score += 0.1
         return min(1.0, score)
 
-    def _analyze_risk(self, proposal: Proposal) -> float:
-        desc = proposal.description.lower()
-        title = proposal.title.lower()
-        high_risk = ['risky', 'experimental', 'untested', 'no audit', 'instant', 'immediately']
-        medium_risk = ['new', 'change', 'modify', 'remove']
-        low_risk = ['audit', 'tested', 'proven', 'standard', 'established']
+    def _analyze_risk(self, found: Dict[str, set], title_found: Dict[str, set]) -> float:
         score = 0.6
-        for kw in high_risk:
-            if kw in desc or kw in title:
-                score -= 0.2
-        for kw in medium_risk:
-            if kw in desc or kw in title:
-                score -= 0.05
-        for kw in low_risk:
-            if kw in desc:
-                score += 0.1
+        for _ in found['high_risk'] | title_found['high_risk']:
+            score -= 0.2
+        for _ in found['medium_risk'] | title_found['medium_risk']:
+            score -= 0.05
+        for _ in found['low_risk']:
+            score += 0.1
         return max(0.0, min(1.0, score))
 
     def cast_vote(self, proposal_id: int, vote: VoteChoice, dry_run: bool = True) -> Dict:
         vote_record = {
             "timestamp": int(time.time()),
             "proposal_id": proposal_id,
-            "vote": vote.name,
+            "vote": int(vote),
             "dry_run": dry_run
         }
         self.voting_history.append(vote_record)
-        if dry_run or self.use_mock_data:
-            print(f"\n  [DRY RUN] Vote recorded: {vote.name}")
-        else:
-            print(f"\n  ✓ Vote submitted to blockchain: {vote.name}")
+        if self.verbose:
+            if dry_run or self.use_mock_data:
+                print(f"\n  [DRY RUN] Vote recorded: {vote.name}")
+            else:
+                print(f"\n  ✓ Vote submitted to blockchain: {vote.name}")
         return vote_record
 
     def generate_charts(self):
@@ -257,16 +631,24 @@ class DAOGovernanceAgent:
             print("\n⚠️ No analysis data available for charts. Run governance cycle first.")
             return
         
+        import numpy as np
+        plt = _import_pyplot()
+        
         labels = [f"Proposal #{a['proposal_id']}" for a in self.analyses]
         
+        # One (N, 4) matrix, one column per score category
+        scores = np.array(
+            [[a["scores"][key] for key in SCORE_KEYS] for a in self.analyses],
+            dtype=np.float64
+        )
+        
         # 1. Proposal Analysis Scores (Bar Chart)
         plt.figure(figsize=(10, 6))
         x = np.arange(len(labels))
         width = 0.2
-        plt.bar(x - 0.3, [a["scores"]["treasury_impact"] for a in self.analyses], width, label='Treasury Impact', color='#4BC0C0')
-        plt.bar(x - 0.1, [a["scores"]["community_alignment"] for a in self.analyses], width, label='Community Alignment', color='#36A2EB')
-        plt.bar(x + 0.1, [a["scores"]["technical_feasibility"] for a in self.analyses], width, label='Technical Feasibility', color='#FFCE56')
-        plt.bar(x + 0.3, [a["scores"]["risk_assessment"] for a in self.analyses], width, label='Risk Assessment', color='#FF6384')
+        offsets = (-0.3, -0.1, 0.1, 0.3)
+        for i, (label, color) in enumerate(zip(SCORE_LABELS, SCORE_COLORS)):
+            plt.bar(x + offsets[i], scores[:, i], width, label=label, color=color)
         plt.xlabel('Proposals')
         plt.ylabel('Score (0-1)')
         plt.title('Proposal Analysis Scores by Category')
@@ -289,11 +671,9 @@ class DAOGovernanceAgent:
         plt.show()
 
         # 3. Voting Summary (Pie Chart)
-        for_count = sum(1 for v in self.voting_history if v['vote'] == 'FOR')
-        against_count = sum(1 for v in self.voting_history if v['vote'] == 'AGAINST')
-        abstain_count = sum(1 for v in self.voting_history if v['vote'] == 'ABSTAIN')
+        counts = Counter(v['vote'] for v in self.voting_history)
         plt.figure(figsize=(8, 8))
-        plt.pie([for_count, against_count, abstain_count], labels=['FOR', 'AGAINST', 'ABSTAIN'], 
+        plt.pie([counts[choice] for choice in VoteChoice], labels=[choice.name for choice in VoteChoice], 
                 colors=['#4BC0C0', '#FF6384', '#FFCE56'], autopct='%1.1f%%')
         plt.title('Voting Summary Distribution')
         plt.tight_layout()
@@ -316,7 +696,6 @@ class DAOGovernanceAgent:
         for proposal in proposals:
             analysis = self.analyze_proposal(proposal)
             self.cast_vote(proposal.id, analysis['recommendation'], dry_run)
-            time.sleep(1)
         
         print("\n" + "="*60)
         print("✓ Governance Cycle Complete")
@@ -333,17 +712,13 @@ class DAOGovernanceAgent:
         print(f"{'='*60}")
         print(f"Total Votes: {len(self.voting_history)}")
         
-        for_count = sum(1 for v in self.voting_history if v['vote'] == 'FOR')
-        against_count = sum(1 for v in self.voting_history if v['vote'] == 'AGAINST')
-        abstain_count = sum(1 for v in self.voting_history if v['vote'] == 'ABSTAIN')
-        
-        print(f"  FOR: {for_count}")
-        print(f"  AGAINST: {against_count}")
-        print(f"  ABSTAIN: {abstain_count}")
+        counts = Counter(v['vote'] for v in self.voting_history)
+        for choice in VoteChoice:
+            print(f"  {choice.name}: {counts[choice]}")
         
         print(f"\n📝 Vote History:")
         for vote in self.voting_history:
-            print(f"  Proposal #{vote['proposal_id']}: {vote['vote']}")
+            print(f"  Proposal #{vote['proposal_id']}: {VoteChoice(vote['vote']).name}")
 
     def export_metrics(self) -> Dict:
         return {
@@ -385,5 +760,5 @@ if __name__ == "__main__":
     print("\n✓ Analysis complete!")
     print("\nTo run with real blockchain:")
     print("  1. Deploy actual contracts")
-    print("  2. Update use_mock_data=False")
-    print("  3. Implement Web3 contract interactions in monitor_proposals and cast_vote")
\ No newline at end of file
+    print("  2. Pass use_mock_data=False and governance_address=<SimpleDAOGovernance address>")
+    print("  3. Implement vote transaction submission in cast_vote")
\ No newline at end of file